@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 """Parse Prototype-style workbook and refresh JSON artifacts.
 
-This parser intentionally uses only Python stdlib (zip+xml) so it runs in
-restricted environments without extra dependencies.
+This parser only requires the Python stdlib (zip+xml) so it runs in
+restricted environments without extra dependencies. orjson is used for
+writing the JSON artifacts when available.
 """
 
 from __future__ import annotations
@@ -12,10 +13,16 @@ import json
 import os
 import re
 import shutil
+import sys
 import zipfile
 import xml.etree.ElementTree as ET
-from collections import Counter
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 NS = {
     "m": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
@@ -23,6 +30,37 @@ NS = {
     "pr": "http://schemas.openxmlformats.org/package/2006/relationships",
 }
 
+# Namespace-qualified tags and paths, resolved once so hot loops skip prefix lookups.
+TAG_SHEET_DATA = f"{{{NS['m']}}}sheetData"
+TAG_ROW = f"{{{NS['m']}}}row"
+TAG_C = f"{{{NS['m']}}}c"
+TAG_V = f"{{{NS['m']}}}v"
+TAG_F = f"{{{NS['m']}}}f"
+TAG_IS = f"{{{NS['m']}}}is"
+TAG_T = f"{{{NS['m']}}}t"
+TAG_SI = f"{{{NS['m']}}}si"
+TAG_DIMENSION = f"{{{NS['m']}}}dimension"
+TAG_DATA_VALIDATION = f"{{{NS['m']}}}dataValidation"
+TAG_SHEETS = f"{{{NS['m']}}}sheets"
+TAG_SHEET = f"{{{NS['m']}}}sheet"
+TAG_DEFINED_NAMES = f"{{{NS['m']}}}definedNames"
+TAG_DEFINED_NAME = f"{{{NS['m']}}}definedName"
+TAG_COMMENT_LIST = f"{{{NS['m']}}}commentList"
+TAG_COMMENT = f"{{{NS['m']}}}comment"
+TAG_RELATIONSHIP = f"{{{NS['pr']}}}Relationship"
+ATTR_REL_ID = f"{{{NS['r']}}}id"
+
+PATH_INLINE_TEXT = f"{TAG_IS}/{TAG_T}"
+PATH_RICH_TEXT = f".//{TAG_T}"
+PATH_COMMENTS = f"{TAG_COMMENT_LIST}/{TAG_COMMENT}"
+PATH_SHEETS = f"{TAG_SHEETS}/{TAG_SHEET}"
+
+SUM_RANGE_PATTERN = re.compile(r"SUM\(E(\d+):E(\d+)\)$")
+SUM_SINGLE_PATTERN = re.compile(r"SUM\(E(\d+)\)$")
+
+OVERRIDE_KEYS = ("S", "M", "L", "Custom", "Details")
+MAIN_ROW_COLUMNS = ("A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "N")
+
 
 def col_to_num(col: str) -> int:
     num = 0
@@ -33,25 +71,39 @@ def col_to_num(col: str) -> int:
 
 
 def split_ref(ref: str) -> Tuple[str, int]:
-    match = re.match(r"([A-Z]+)(\d+)", ref)
-    if not match:
+    length = len(ref)
+    split = 0
+    while split < length and "A" <= ref[split] <= "Z":
+        split += 1
+    end = split
+    while end < length and "0" <= ref[end] <= "9":
+        end += 1
+    if split == 0 or end == split:
         return "", 0
-    return match.group(1), int(match.group(2))
+    return ref[:split], int(ref[split:end])
 
 
 def join_si_text(si: ET.Element) -> str:
-    direct = si.find("m:t", NS)
+    direct = si.find(TAG_T)
     if direct is not None:
         return direct.text or ""
-    return "".join((part.text or "") for part in si.findall(".//m:t", NS))
+    return "".join((part.text or "") for part in si.findall(PATH_RICH_TEXT))
 
 
-def parse_shared_strings(zf: zipfile.ZipFile) -> List[str]:
-    if "xl/sharedStrings.xml" not in zf.namelist():
+def parse_shared_strings(zf: zipfile.ZipFile, names: FrozenSet[str]) -> List[str]:
+    if "xl/sharedStrings.xml" not in names:
         return []
 
-    root = ET.fromstring(zf.read("xl/sharedStrings.xml"))
-    return [join_si_text(si) for si in root.findall("m:si", NS)]
+    shared_strings: List[str] = []
+    with zf.open("xl/sharedStrings.xml") as stream:
+        context = ET.iterparse(stream, events=("start", "end"))
+        _, root = next(context)
+        for event, elem in context:
+            if event == "end" and elem.tag == TAG_SI:
+                # Interned so repeated strings share one object across all cell payloads.
+                shared_strings.append(sys.intern(join_si_text(elem)))
+                root.remove(elem)
+    return shared_strings
 
 
 def normalize_target(target: str) -> str:
@@ -62,124 +114,167 @@ def normalize_target(target: str) -> str:
     return f"xl/{target.replace('../', '')}"
 
 
-def decode_value(cell: ET.Element, shared_strings: List[str]) -> Optional[str]:
-    cell_type = cell.get("t")
-    value_node = cell.find("m:v", NS)
-
-    if cell_type == "s" and value_node is not None and value_node.text is not None:
-        try:
-            return shared_strings[int(value_node.text)]
-        except Exception:
-            return value_node.text
-
-    if cell_type == "inlineStr":
-        inline = cell.find("m:is/m:t", NS)
-        return inline.text if inline is not None else ""
-
-    if cell_type == "b" and value_node is not None:
-        return "TRUE" if value_node.text == "1" else "FALSE"
-
-    if value_node is not None:
-        return value_node.text
-
-    return None
-
-
-def build_cell_payload(cell: ET.Element, shared_strings: List[str]) -> Dict[str, Any]:
-    ref = cell.get("r", "")
-    payload: Dict[str, Any] = {"ref": ref}
-
-    formula_node = cell.find("m:f", NS)
-    value_node = cell.find("m:v", NS)
-
+class CellPayload:
+    """Parsed cell; formula is None when the cell has no <f> element."""
+
+    __slots__ = ("ref", "value", "formula", "shared_si")
+
+    def __init__(
+        self,
+        ref: str,
+        value: Optional[str],
+        formula: Optional[str] = None,
+        shared_si: Optional[str] = None,
+    ) -> None:
+        self.ref = ref
+        self.value = value
+        self.formula = formula
+        self.shared_si = shared_si
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"ref": self.ref}
+        if self.formula is not None:
+            payload["formula"] = self.formula
+            payload["shared_si"] = self.shared_si
+        payload["value"] = self.value
+        return payload
+
+
+def build_cell_payload(cell: ET.Element, shared_strings: List[str]) -> CellPayload:
+    formula: Optional[str] = None
+    shared_si: Optional[str] = None
+    formula_node = cell.find(TAG_F)
     if formula_node is not None:
-        payload["formula"] = (formula_node.text or "")
-        payload["shared_si"] = formula_node.get("si")
-
-    payload["value"] = decode_value(cell, shared_strings)
-    payload["cached"] = value_node.text if value_node is not None else None
-
-    return payload
+        formula = formula_node.text or ""
+        shared_si = formula_node.get("si")
 
+    cell_type = cell.get("t")
+    value_node = cell.find(TAG_V)
+    raw = value_node.text if value_node is not None else None
 
-def parse_sheet_comments_count(zf: zipfile.ZipFile, sheet_path: str) -> int:
+    # Type checks ordered by how common they are in the workbook.
+    if cell_type == "s" and raw is not None:
+        try:
+            value = shared_strings[int(raw)]
+        except (ValueError, IndexError):
+            value = raw
+    elif cell_type is None:
+        value = raw
+    elif cell_type == "b" and value_node is not None:
+        value = "TRUE" if raw == "1" else "FALSE"
+    elif cell_type == "inlineStr":
+        inline = cell.find(PATH_INLINE_TEXT)
+        value = inline.text if inline is not None else ""
+    else:
+        value = raw
+
+    return CellPayload(cell.get("r", ""), value, formula, shared_si)
+
+
+def parse_sheet_comments_count(
+    zf: zipfile.ZipFile, sheet_path: str, names: FrozenSet[str]
+) -> int:
     rels_path = f"xl/worksheets/_rels/{os.path.basename(sheet_path)}.rels"
-    if rels_path not in zf.namelist():
+    if rels_path not in names:
         return 0
 
     rels_root = ET.fromstring(zf.read(rels_path))
     count = 0
-    for rel in rels_root.findall("pr:Relationship", NS):
+    for rel in rels_root.findall(TAG_RELATIONSHIP):
         rel_type = rel.get("Type", "")
         if rel_type.endswith("/comments"):
             target = normalize_target(rel.get("Target", ""))
-            if target in zf.namelist():
+            if target in names:
                 comments_root = ET.fromstring(zf.read(target))
-                count += len(comments_root.findall("m:commentList/m:comment", NS))
+                count += len(comments_root.findall(PATH_COMMENTS))
     return count
 
 
 def parse_sheet(
-    zf: zipfile.ZipFile, sheet_name: str, sheet_path: str, shared_strings: List[str]
+    zf: zipfile.ZipFile,
+    sheet_name: str,
+    sheet_path: str,
+    shared_strings: List[str],
+    names: FrozenSet[str],
 ) -> Dict[str, Any]:
-    root = ET.fromstring(zf.read(sheet_path))
-
-    cells: Dict[str, Dict[str, Any]] = {}
+    columns: Dict[str, Dict[int, CellPayload]] = {}
     formula_count = 0
     hidden_rows: List[int] = []
+    dimension: Optional[str] = None
+    data_validation_count = 0
+    sheet_data: Optional[ET.Element] = None
+
+    # Stream the worksheet row by row so only one <row> subtree is alive at a time.
+    with zf.open(sheet_path) as stream:
+        for event, elem in ET.iterparse(stream, events=("start", "end")):
+            tag = elem.tag
+            if event == "start":
+                if tag == TAG_SHEET_DATA:
+                    sheet_data = elem
+                continue
 
-    for row in root.findall("m:sheetData/m:row", NS):
-        row_num = int(row.get("r", "0"))
-        if row.get("hidden") == "1":
-            hidden_rows.append(row_num)
-
-        for cell in row.findall("m:c", NS):
-            payload = build_cell_payload(cell, shared_strings)
-            if "formula" in payload:
-                formula_count += 1
-            cells[payload["ref"]] = payload
-
-    dimension_node = root.find("m:dimension", NS)
-    dimension = dimension_node.get("ref") if dimension_node is not None else None
-
-    data_validations = root.find("m:dataValidations", NS)
-    data_validation_count = (
-        len(data_validations.findall("m:dataValidation", NS))
-        if data_validations is not None
-        else 0
-    )
+            if tag == TAG_ROW:
+                row_attr = elem.get("r", "0")
+                row_len = len(row_attr)
+                row_num = int(row_attr)
+                if elem.get("hidden") == "1":
+                    hidden_rows.append(row_num)
+
+                for cell in elem.findall(TAG_C):
+                    payload = build_cell_payload(cell, shared_strings)
+                    if payload.formula is not None:
+                        formula_count += 1
+                    ref = payload.ref
+                    # Cell refs end with their row's r attribute, so the column is the
+                    # prefix; anything irregular goes through split_ref.
+                    col = ref[:-row_len]
+                    if ref[-row_len:] == row_attr and col.isalpha():
+                        cell_row = row_num
+                    else:
+                        col, cell_row = split_ref(ref)
+                    column = columns.get(col)
+                    if column is None:
+                        column = columns[col] = {}
+                    column[cell_row] = payload
+
+                if sheet_data is not None:
+                    sheet_data.remove(elem)
+            elif tag == TAG_DIMENSION:
+                dimension = elem.get("ref")
+            elif tag == TAG_DATA_VALIDATION:
+                data_validation_count += 1
 
     return {
         "name": sheet_name,
         "path": sheet_path,
-        "root": root,
-        "cells": cells,
+        "columns": columns,
         "dimension": dimension,
         "formula_count": formula_count,
-        "comment_count": parse_sheet_comments_count(zf, sheet_path),
+        "comment_count": parse_sheet_comments_count(zf, sheet_path, names),
         "data_validation_count": data_validation_count,
-        "hidden_rows": sorted(hidden_rows),
+        "hidden_rows_sorted": tuple(sorted(hidden_rows)),
+        "hidden_rows_set": frozenset(hidden_rows),
     }
 
 
 def workbook_index(zf: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], List[Dict[str, Any]]]:
     workbook = ET.fromstring(zf.read("xl/workbook.xml"))
     rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
-    rel_map = {rel.get("Id"): rel.get("Target") for rel in rels.findall("pr:Relationship", NS)}
+    rel_map = {rel.get("Id"): rel.get("Target") for rel in rels.findall(TAG_RELATIONSHIP)}
 
     sheets: List[Tuple[str, str]] = []
-    for sheet in workbook.findall("m:sheets/m:sheet", NS):
+    for sheet in workbook.findall(PATH_SHEETS):
         sheet_name = sheet.get("name", "")
-        rel_id = sheet.get(f"{{{NS['r']}}}id")
+        rel_id = sheet.get(ATTR_REL_ID)
         target = rel_map.get(rel_id)
         if not target:
             continue
         sheets.append((sheet_name, normalize_target(target)))
 
     defined_names: List[Dict[str, Any]] = []
-    dn_parent = workbook.find("m:definedNames", NS)
+    dn_parent = workbook.find(TAG_DEFINED_NAMES)
     if dn_parent is not None:
-        for dn in dn_parent.findall("m:definedName", NS):
+        for dn in dn_parent.findall(TAG_DEFINED_NAME):
             defined_names.append(
                 {
                     "name": dn.get("name"),
@@ -191,28 +286,33 @@ def workbook_index(zf: zipfile.ZipFile) -> Tuple[List[Tuple[str, str]], List[Dic
     return sheets, defined_names
 
 
+def get_cell(sheet: Dict[str, Any], ref: str) -> Optional[CellPayload]:
+    col, row = split_ref(ref)
+    return sheet["columns"].get(col, {}).get(row)
+
+
 def get_value(sheet: Dict[str, Any], ref: str) -> Optional[Any]:
-    cell = sheet["cells"].get(ref)
-    if not cell:
+    cell = get_cell(sheet, ref)
+    if cell is None:
         return None
+    return cell.value
 
-    value = cell.get("value")
-    if value is not None:
-        return value
 
-    cached = cell.get("cached")
-    return cached
+def column_value(column: Dict[int, CellPayload], row: int) -> Optional[Any]:
+    cell = column.get(row)
+    if cell is None:
+        return None
+    return cell.value
 
 
 def get_formula(sheet: Dict[str, Any], ref: str) -> Optional[str]:
-    cell = sheet["cells"].get(ref)
-    if not cell:
+    cell = get_cell(sheet, ref)
+    if cell is None:
         return None
-    if "formula" in cell:
-        return cell.get("formula") or ""
-    return None
+    return cell.formula
 
 
+@lru_cache(maxsize=None)
 def normalize_compare(value: Optional[Any]) -> Optional[Any]:
     if value is None:
         return None
@@ -227,36 +327,39 @@ def normalize_compare(value: Optional[Any]) -> Optional[Any]:
     try:
         number = float(text)
         return int(number) if number.is_integer() else round(number, 6)
-    except Exception:
+    except ValueError:
         return text
 
 
 def build_sections(base_sheet: Dict[str, Any]) -> List[Dict[str, Any]]:
     sections: List[Dict[str, Any]] = []
+    names = base_sheet["columns"].get("B", {})
+    crm_ids = base_sheet["columns"].get("C", {})
 
-    for ref, cell in base_sheet["cells"].items():
-        col, row = split_ref(ref)
-        if col != "E" or "formula" not in cell:
+    for row, cell in base_sheet["columns"].get("E", {}).items():
+        formula = cell.formula
+        if formula is None:
             continue
 
-        formula = cell.get("formula") or ""
-        range_match = re.match(r"SUM\(E(\d+):E(\d+)\)$", formula)
-        single_match = re.match(r"SUM\(E(\d+)\)$", formula)
+        if not formula.startswith("SUM(E"):
+            continue
 
+        range_match = SUM_RANGE_PATTERN.match(formula)
         if range_match:
             start_row = int(range_match.group(1))
             end_row = int(range_match.group(2))
-        elif single_match:
+        else:
+            single_match = SUM_SINGLE_PATTERN.match(formula)
+            if not single_match:
+                continue
             start_row = int(single_match.group(1))
             end_row = int(single_match.group(1))
-        else:
-            continue
 
         sections.append(
             {
                 "header_row": row,
-                "name": get_value(base_sheet, f"B{row}"),
-                "crm_id": get_value(base_sheet, f"C{row}"),
+                "name": column_value(names, row),
+                "crm_id": column_value(crm_ids, row),
                 "start_row": start_row,
                 "end_row": end_row,
             }
@@ -270,14 +373,24 @@ def build_service_items(base_sheet: Dict[str, Any], sections: List[Dict[str, Any
     seen_rows = set()
     services: List[Dict[str, Any]] = []
 
+    columns = base_sheet["columns"]
+    names = columns.get("B", {})
+    crm_ids = columns.get("C", {})
+    default_efforts = columns.get("D", {})
+    templates_s = columns.get("E", {})
+    templates_m = columns.get("F", {})
+    templates_l = columns.get("G", {})
+    templates_custom = columns.get("H", {})
+    templates_details = columns.get("I", {})
+
     for section in sections:
         for row in range(section["start_row"], section["end_row"] + 1):
             if row in seen_rows:
                 continue
             seen_rows.add(row)
 
-            name = get_value(base_sheet, f"B{row}")
-            crm_id = get_value(base_sheet, f"C{row}")
+            name = column_value(names, row)
+            crm_id = column_value(crm_ids, row)
             if name is None and crm_id is None:
                 continue
 
@@ -287,12 +400,12 @@ def build_service_items(base_sheet: Dict[str, Any], sections: List[Dict[str, Any
                     "section": section["name"],
                     "service_name": name,
                     "crm_id": crm_id,
-                    "default_effort": get_value(base_sheet, f"D{row}"),
-                    "template_S": get_value(base_sheet, f"E{row}"),
-                    "template_M": get_value(base_sheet, f"F{row}"),
-                    "template_L": get_value(base_sheet, f"G{row}"),
-                    "template_Custom": get_value(base_sheet, f"H{row}"),
-                    "template_Details": get_value(base_sheet, f"I{row}"),
+                    "default_effort": column_value(default_efforts, row),
+                    "template_S": column_value(templates_s, row),
+                    "template_M": column_value(templates_m, row),
+                    "template_L": column_value(templates_l, row),
+                    "template_Custom": column_value(templates_custom, row),
+                    "template_Details": column_value(templates_details, row),
                 }
             )
 
@@ -320,6 +433,12 @@ def build_domain_model(
     sections = build_sections(base_sheet)
     services = build_service_items(base_sheet, sections)
 
+    # Template values are identical for every scenario, so normalize them once.
+    template_norms = [
+        tuple(normalize_compare(service.get(f"template_{key}")) for key in OVERRIDE_KEYS)
+        for service in services
+    ]
+
     scenarios: List[Dict[str, Any]] = []
     for name in sheet_order:
         if name in {"Max Engagement Quick Sizer", "Scenario Template"}:
@@ -328,27 +447,21 @@ def build_domain_model(
         scenario_sheet = sheets[name]
         layout, custom_col, detail_col, totals_total_cell = detect_layout(scenario_sheet)
 
+        columns = scenario_sheet["columns"]
+        value_columns = [
+            (key, columns.get(col, {}))
+            for key, col in zip(OVERRIDE_KEYS, ("E", "F", "G", custom_col, detail_col))
+        ]
+
         overrides: List[Dict[str, Any]] = []
 
-        for service in services:
+        for service, template_norm in zip(services, template_norms):
             row = service["row"]
-            current_values = {
-                "S": get_value(scenario_sheet, f"E{row}"),
-                "M": get_value(scenario_sheet, f"F{row}"),
-                "L": get_value(scenario_sheet, f"G{row}"),
-                "Custom": get_value(scenario_sheet, f"{custom_col}{row}"),
-                "Details": get_value(scenario_sheet, f"{detail_col}{row}"),
-            }
+            current_values = {key: column_value(column, row) for key, column in value_columns}
 
             changed = False
-            for key, template_key in [
-                ("S", "template_S"),
-                ("M", "template_M"),
-                ("L", "template_L"),
-                ("Custom", "template_Custom"),
-                ("Details", "template_Details"),
-            ]:
-                if normalize_compare(current_values[key]) != normalize_compare(service.get(template_key)):
+            for key, template_value in zip(OVERRIDE_KEYS, template_norm):
+                if normalize_compare(current_values[key]) != template_value:
                     changed = True
                     break
 
@@ -394,11 +507,15 @@ def build_totals_payload(
 ) -> Dict[str, Any]:
     main = sheets["Max Engagement Quick Sizer"]
 
+    main_columns = [(col, main["columns"].get(col, {})) for col in MAIN_ROW_COLUMNS]
+
     main_rows: List[Dict[str, Any]] = []
     for row in range(7, 31):
         row_payload: Dict[str, Any] = {"row": row}
-        for col in ["A", "B", "C", "D", "E", "F", "G", "H", "I", "J", "K", "N"]:
-            row_payload[col] = main["cells"].get(f"{col}{row}")
+        for col, column in main_columns:
+            cell = column.get(row)
+            if cell is not None:
+                row_payload[col] = cell
         main_rows.append(row_payload)
 
     scenario_totals: List[Dict[str, Any]] = []
@@ -407,18 +524,17 @@ def build_totals_payload(
             continue
 
         sheet = sheets[name]
-        hidden = set(sheet["hidden_rows"])
-        visible_rows = len([row for row in range(1, 131) if row not in hidden])
+        visible_rows = 130 - sum(1 for row in sheet["hidden_rows_set"] if 1 <= row <= 130)
 
         scenario_totals.append(
             {
                 "scenario": name,
-                "E2": sheet["cells"].get("E2"),
-                "F2": sheet["cells"].get("F2"),
-                "G2": sheet["cells"].get("G2"),
-                "H2": sheet["cells"].get("H2"),
-                "I2": sheet["cells"].get("I2"),
-                "J2": sheet["cells"].get("J2"),
+                "E2": get_cell(sheet, "E2"),
+                "F2": get_cell(sheet, "F2"),
+                "G2": get_cell(sheet, "G2"),
+                "H2": get_cell(sheet, "H2"),
+                "I2": get_cell(sheet, "I2"),
+                "J2": get_cell(sheet, "J2"),
                 "visible_rows": visible_rows,
             }
         )
@@ -438,7 +554,8 @@ def build_visibility_payload(
             continue
 
         sheet = sheets[name]
-        hidden_rows = set(sheet["hidden_rows"])
+        hidden_rows = sheet["hidden_rows_set"]
+        service_names = sheet["columns"].get("B", {})
 
         visible_sections: List[str] = []
         hidden_sections: List[str] = []
@@ -454,7 +571,7 @@ def build_visibility_payload(
             for row in range(section["start_row"], section["end_row"] + 1):
                 if row in hidden_rows:
                     continue
-                if get_value(sheet, f"B{row}") is not None:
+                if column_value(service_names, row) is not None:
                     visible_service_rows += 1
 
         visibility.append(
@@ -464,7 +581,7 @@ def build_visibility_payload(
                 "visible_service_rows": visible_service_rows,
                 "visible_sections": visible_sections,
                 "hidden_sections": hidden_sections,
-                "hidden_rows_sorted": sorted(list(hidden_rows)),
+                "hidden_rows_sorted": sheet["hidden_rows_sorted"],
             }
         )
 
@@ -486,7 +603,7 @@ def build_workbook_profile(
                 "formula_cells": sheet["formula_count"],
                 "comment_count": sheet["comment_count"],
                 "data_validation_count": sheet["data_validation_count"],
-                "hidden_rows_count": len(sheet["hidden_rows"]),
+                "hidden_rows_count": len(sheet["hidden_rows_sorted"]),
             }
         )
 
@@ -498,21 +615,37 @@ def build_workbook_profile(
     }
 
 
+def json_default(value: Any) -> Any:
+    if isinstance(value, CellPayload):
+        return value.to_dict()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
 def write_json(path: str, payload: Any) -> None:
+    if orjson is not None:
+        with open(path, "wb") as handle:
+            handle.write(
+                orjson.dumps(payload, default=json_default, option=orjson.OPT_INDENT_2)
+            )
+        return
+
+    # json.dump streams iterencode() chunks to the handle rather than building
+    # one string; ensure_ascii=False keeps the output byte-identical to orjson's.
     with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=2)
+        json.dump(payload, handle, indent=2, ensure_ascii=False, default=json_default)
 
 
 def run(input_path: str, output_dir: str, analysis_dir: Optional[str]) -> Dict[str, Any]:
     with zipfile.ZipFile(input_path) as workbook_zip:
-        shared_strings = parse_shared_strings(workbook_zip)
+        names = frozenset(workbook_zip.namelist())
+        shared_strings = parse_shared_strings(workbook_zip, names)
         indexed_sheets, defined_names = workbook_index(workbook_zip)
 
         sheet_order = [name for name, _ in indexed_sheets]
         parsed_sheets: Dict[str, Dict[str, Any]] = {}
         for sheet_name, sheet_path in indexed_sheets:
             parsed_sheets[sheet_name] = parse_sheet(
-                workbook_zip, sheet_name, sheet_path, shared_strings
+                workbook_zip, sheet_name, sheet_path, shared_strings, names
             )
 
     domain_model = build_domain_model(parsed_sheets, sheet_order)
@@ -522,6 +655,10 @@ def run(input_path: str, output_dir: str, analysis_dir: Optional[str]) -> Dict[s
     )
     workbook_profile = build_workbook_profile(parsed_sheets, sheet_order, defined_names)
 
+    # Only the payloads are needed from here on; release the parsed cell stores
+    # before serializing so they don't add to the write-time peak.
+    del parsed_sheets, shared_strings
+
     os.makedirs(output_dir, exist_ok=True)
     write_json(os.path.join(output_dir, "domain_model.json"), domain_model)
     write_json(os.path.join(output_dir, "totals.json"), totals_payload)